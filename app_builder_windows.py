@@ -47,11 +47,147 @@ the script unless you specify a custom location.
 import os
 import shutil
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog, messagebox
 from datetime import datetime
+from pathlib import Path
+from string import Template
 import zipfile
 
 
+# File extensions that are already compressed and are stored as-is when the
+# project is zipped.
+_STORED_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".zip"})
+
+# Buffer size for the ZIP output file, so archive data reaches the disk in
+# large writes.
+_ZIP_WRITE_BUFFER = 1 << 20
+
+
+class _SanitizeTable(dict):
+    """``str.translate`` table that keeps letters, digits, spaces, ``-`` and ``_``.
+
+    Entries are computed on first lookup and cached, so repeated characters
+    are resolved by a plain dict hit inside ``translate``.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in " -_" else None
+        self[codepoint] = value
+        return value
+
+
+_SANITIZE_TABLE = _SanitizeTable()
+
+# Contents of the generated project files.  The template is parsed and the
+# fixed text encoded once at import time; the ``_generate_*`` methods only
+# fill in the per-project values.
+_MAIN_DART_TEMPLATE = Template("""
+import 'package:flutter/material.dart';
+
+void main() => runApp(const MyApp());
+
+class MyApp extends StatelessWidget {
+  const MyApp({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return MaterialApp(
+      title: '${app_name}',
+      theme: ThemeData(primarySwatch: Colors.blue),
+      home: const HomePage(),
+    );
+  }
+}
+
+class HomePage extends StatelessWidget {
+  const HomePage({super.key});
+
+  @override
+  Widget build(BuildContext context) {
+    return Scaffold(
+      appBar: AppBar(title: const Text('${app_name}')),
+      body: Center(
+        child: Column(
+          mainAxisAlignment: MainAxisAlignment.center,
+          children: <Widget>[
+${images_code}
+            const SizedBox(height: 20),
+            Text('This is a ${app_type} app built with App Builder!', style: const TextStyle(fontSize: 18)),${paywall_code}
+          ],
+        ),
+      ),
+    );
+  }
+}
+""")
+
+# pubspec.yaml up to and including the ``assets:`` key; the asset list is
+# appended per project.
+_PUBSPEC_HEAD_BYTES = """
+name: example_app
+description: A simple project scaffold generated by App Builder.
+publish_to: none
+version: 1.0.0+1
+
+environment:
+  sdk: '>=3.0.0 <4.0.0'
+
+dependencies:
+  flutter:
+    sdk: flutter
+  cupertino_icons: ^1.0.6
+
+dev_dependencies:
+  flutter_test:
+    sdk: flutter
+
+flutter:
+  uses-material-design: true
+  assets:
+""".encode("utf-8")
+
+# README text that follows the ``# <app name>`` heading.
+_README_BODY_BYTES = """
+
+This project was generated using the App Builder for Windows.  It provides a
+minimal Flutter scaffold that displays any images you uploaded and includes
+optional paywall placeholders.  To continue building and publishing your app to
+the Apple App Store, follow these steps:
+
+1. **Install Flutter:** If you haven’t already, download and install Flutter from
+   [flutter.dev](https://flutter.dev).  Make sure you can run `flutter doctor` without
+   errors on your system.
+2. **Move project to macOS:** To build and publish an iOS app, you will need a
+   Mac with Xcode installed.  Copy this project to a Mac or use a cloud
+   continuous‑integration service that provides macOS build agents.
+3. **Add dependencies:** Open the `pubspec.yaml` file and add any additional
+   packages your app requires.  For paywalls, consider packages like
+   `in_app_purchase`.
+4. **Implement functionality:** Edit `lib/main.dart` and other Dart files to
+   implement your tool or game logic.  Replace the placeholder code with your
+   actual user interface and business logic.
+5. **Configure app:** Update the Flutter project’s bundle identifier, icons and
+   other metadata in the iOS `Runner` Xcode project.  You can find more details
+   in the Flutter documentation.
+6. **Test and publish:** Use `flutter build ios` to produce an iOS build.
+   Then open the generated Xcode workspace, run your app on a simulator or
+   device, fix any issues and submit through App Store Connect.
+
+Enjoy building your app!
+""".encode("utf-8")
+
+# Placeholder written to PAYWALL.txt when the paywall option is enabled.
+_PAYWALL_BYTES = (
+    "This project includes a placeholder for implementing a paywall.\n"
+    "To enable in‑app purchases on iOS, you will need to integrate Apple’s StoreKit.\n"
+    "If you choose a cross‑platform framework like Flutter, add the `in_app_purchase`\n"
+    "package in your pubspec.yaml and follow the documentation to configure products\n"
+    "in App Store Connect.\n"
+).encode("utf-8")
+
+
 class AppBuilderGUI:
     """Graphical interface for scaffolding simple app projects."""
 
@@ -59,6 +195,10 @@ class AppBuilderGUI:
         self.master = master
         self.master.title("App Builder for Apple App Store")
         self.assets = []
+        # File names of ``self.assets``, computed once when the images are added.
+        self._asset_names = []
+        # Set mirror of ``self.assets`` for constant-time duplicate checks.
+        self._assets_set = set()
 
         # Create and lay out widgets
         self._create_widgets()
@@ -105,10 +245,17 @@ class AppBuilderGUI:
             title="Choose images",
             filetypes=[("Image files", "*.png;*.jpg;*.jpeg;*.gif;*.bmp"), ("All files", "*.*")],
         )
+        new_names = []
         for file in files:
-            if file not in self.assets:
+            if file not in self._assets_set:
+                image_name = os.path.basename(file)
+                self._assets_set.add(file)
                 self.assets.append(file)
-                self.images_listbox.insert(tk.END, os.path.basename(file))
+                self._asset_names.append(image_name)
+                new_names.append(image_name)
+        # Insert all new entries with one Tk call rather than one per file
+        if new_names:
+            self.images_listbox.insert(tk.END, *new_names)
 
     def browse_output_directory(self) -> None:
         """Open a directory chooser for selecting the output directory."""
@@ -118,7 +265,7 @@ class AppBuilderGUI:
 
     def _sanitize_name(self, name: str) -> str:
         """Return a filesystem‑safe version of the app name."""
-        return "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_')
+        return name.translate(_SANITIZE_TABLE).strip().replace(' ', '_')
 
     def generate_project(self) -> None:
         """Create the app project structure and copy selected assets."""
@@ -148,39 +295,50 @@ class AppBuilderGUI:
         lib_dir = os.path.join(project_dir, "lib")
         os.makedirs(lib_dir, exist_ok=True)
 
-        # Copy image assets
-        for img_path in self.assets:
-            try:
-                shutil.copy(img_path, os.path.join(assets_dir, os.path.basename(img_path)))
-            except Exception as e:
-                messagebox.showwarning("Asset Copy Error", f"Failed to copy {img_path}: {e}")
+        # Copy image assets.  ``copyfile`` skips the permission-bit copy done by
+        # ``shutil.copy`` and goes straight to the platform fast-copy path
+        # (sendfile on Linux, fcopyfile on macOS, large-buffer copies on Windows).
+        # Each copy is independent and I/O bound, so run them on a small thread
+        # pool and report every failure in a single warning dialog.
+        # Images with the same file name from different folders share a
+        # destination, so they are grouped into one task and copied in upload
+        # order (the last one wins) rather than written concurrently.  Names
+        # are compared case-insensitively, since NTFS and the default macOS
+        # filesystem treat IMG.png and img.png as the same file.
+        tasks = {}
+        for img_path, image_name in zip(self.assets, self._asset_names):
+            dst = os.path.join(assets_dir, image_name)
+            tasks.setdefault(os.path.normcase(dst).lower(), []).append((img_path, dst))
+        copy_errors = []
+        if tasks:
+            with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+                for errors in executor.map(self._copy_assets, tasks.values()):
+                    copy_errors.extend(errors)
+        if copy_errors:
+            messagebox.showwarning("Asset Copy Error", "\n".join(copy_errors))
+
+        # Generated files are built as UTF-8 bytes and written in binary mode with
+        # a single write each, bypassing the text layer.  They always use LF line
+        # endings, which is what Flutter tooling expects.
 
         # Generate main.dart
         main_dart_path = os.path.join(lib_dir, "main.dart")
-        with open(main_dart_path, "w", encoding="utf-8") as f:
-            f.write(self._generate_main_dart_code(name, self.app_type_var.get(), self.paywall_var.get(), self.assets))
+        Path(main_dart_path).write_bytes(
+            self._generate_main_dart_code(name, self.app_type_var.get(), self.paywall_var.get(), self._asset_names)
+        )
 
         # Create pubspec.yaml referencing assets
         pubspec_path = os.path.join(project_dir, "pubspec.yaml")
-        with open(pubspec_path, "w", encoding="utf-8") as f:
-            f.write(self._generate_pubspec_yaml(self.assets))
+        Path(pubspec_path).write_bytes(self._generate_pubspec_yaml(self._asset_names))
 
         # Create README with instructions
         readme_path = os.path.join(project_dir, "README.md")
-        with open(readme_path, "w", encoding="utf-8") as f:
-            f.write(self._generate_readme(name))
+        Path(readme_path).write_bytes(self._generate_readme(name))
 
         # Add placeholder for paywall if needed
         if self.paywall_var.get():
             paywall_file = os.path.join(project_dir, "PAYWALL.txt")
-            with open(paywall_file, "w", encoding="utf-8") as f:
-                f.write(
-                    "This project includes a placeholder for implementing a paywall.\n"
-                    "To enable in‑app purchases on iOS, you will need to integrate Apple’s StoreKit.\n"
-                    "If you choose a cross‑platform framework like Flutter, add the `in_app_purchase`\n"
-                    "package in your pubspec.yaml and follow the documentation to configure products\n"
-                    "in App Store Connect.\n"
-                )
+            Path(paywall_file).write_bytes(_PAYWALL_BYTES)
 
         # Optionally zip the project (ask user)
         if messagebox.askyesno("Zip Project?", "Do you want to package the project into a ZIP archive?"):
@@ -190,25 +348,57 @@ class AppBuilderGUI:
 
         messagebox.showinfo("Success", f"Project generated successfully at:\n{project_dir}")
 
+    @staticmethod
+    def _copy_assets(copies: list) -> list:
+        """Copy each ``(source, destination)`` pair in turn and return any error messages."""
+        errors = []
+        for img_path, dst in copies:
+            try:
+                shutil.copyfile(img_path, dst)
+            except Exception as e:
+                errors.append(f"Failed to copy {img_path}: {e}")
+        return errors
+
     def _zip_directory(self, dir_path: str, zip_path: str) -> None:
         """Create a ZIP archive of the specified directory."""
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            for root, _, files in os.walk(dir_path):
-                for file in files:
-                    full_path = os.path.join(root, file)
-                    rel_path = os.path.relpath(full_path, start=os.path.dirname(dir_path))
-                    zipf.write(full_path, rel_path)
-
-    def _generate_main_dart_code(self, app_name: str, app_type: str, include_paywall: bool, assets: list) -> str:
-        """Return a string containing a minimal Flutter `main.dart` file."""
-        # List asset image names for demonstration
-        image_widgets = []
-        for img_path in assets[:3]:  # limit to first three images for preview
-            image_name = os.path.basename(img_path)
-            image_widgets.append(
-                f"          Image.asset('assets/images/{image_name}', width: 200, height: 200),"
-            )
-        images_code = "\n".join(image_widgets) if image_widgets else "          Text('No images uploaded'),"
+        base = os.path.dirname(dir_path)
+        # Collect the files first so the archive size is known before writing.
+        # Walk the tree with scandir so the file-type checks reuse the
+        # information cached on each DirEntry instead of extra stat calls.
+        files = []
+        total_size = 0
+        stack = [dir_path]
+        while stack:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    files.append((entry.path, os.path.relpath(entry.path, start=base), entry.name))
+                    total_size += entry.stat().st_size
+
+        # ZIP64 records are only needed near the 2 GiB / 65535 entry limits;
+        # leave generous headroom for headers and deflate overhead.
+        needs_zip64 = total_size >= zipfile.ZIP64_LIMIT // 2 or len(files) >= zipfile.ZIP_FILECOUNT_LIMIT
+        with open(zip_path, 'wb', buffering=_ZIP_WRITE_BUFFER) as fp, \
+                zipfile.ZipFile(fp, 'w', zipfile.ZIP_DEFLATED, allowZip64=needs_zip64) as zipf:
+            for full_path, rel_path, file_name in files:
+                # Already-compressed formats gain nothing from deflate, and the
+                # small text files compress nearly as well at the fastest level.
+                if os.path.splitext(file_name)[1].lower() in _STORED_EXTENSIONS:
+                    zipf.write(full_path, rel_path, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.write(full_path, rel_path, compresslevel=1)
+
+    def _generate_main_dart_code(self, app_name: str, app_type: str, include_paywall: bool, asset_names: list) -> bytes:
+        """Return a minimal Flutter `main.dart` file as UTF-8 bytes."""
+        # List asset image names for demonstration, limited to the first three
+        images_code = "\n".join(
+            f"          Image.asset('assets/images/{image_name}', width: 200, height: 200),"
+            for image_name in asset_names[:3]
+        ) or "          Text('No images uploaded'),"
 
         paywall_code = ""
         if include_paywall:
@@ -216,105 +406,21 @@ class AppBuilderGUI:
                 "\n      ElevatedButton(\n        onPressed: () {\n          // TODO: Implement paywall logic and call StoreKit or your preferred in-app purchase API\n        },\n        child: const Text('Unlock premium'),\n      ),"
             )
 
-        return f"""
-import 'package:flutter/material.dart';
-
-void main() => runApp(const MyApp());
-
-class MyApp extends StatelessWidget {{
-  const MyApp({{super.key}});
-
-  @override
-  Widget build(BuildContext context) {{
-    return MaterialApp(
-      title: '{app_name}',
-      theme: ThemeData(primarySwatch: Colors.blue),
-      home: const HomePage(),
-    );
-  }}
-}}
-
-class HomePage extends StatelessWidget {{
-  const HomePage({{super.key}});
-
-  @override
-  Widget build(BuildContext context) {{
-    return Scaffold(
-      appBar: AppBar(title: const Text('{app_name}')),
-      body: Center(
-        child: Column(
-          mainAxisAlignment: MainAxisAlignment.center,
-          children: <Widget>[
-{images_code}
-            const SizedBox(height: 20),
-            Text('This is a {app_type.lower()} app built with App Builder!', style: const TextStyle(fontSize: 18)),{paywall_code}
-          ],
-        ),
-      ),
-    );
-  }}
-}}
-"""
-
-    def _generate_pubspec_yaml(self, assets: list) -> str:
-        """Generate a Flutter pubspec.yaml file listing the assets."""
-        asset_paths = [f"    - assets/images/{os.path.basename(img)}" for img in assets]
-        assets_block = "\n".join(asset_paths) if asset_paths else ""
-        return f"""
-name: example_app
-description: A simple project scaffold generated by App Builder.
-publish_to: none
-version: 1.0.0+1
-
-environment:
-  sdk: '>=3.0.0 <4.0.0'
-
-dependencies:
-  flutter:
-    sdk: flutter
-  cupertino_icons: ^1.0.6
-
-dev_dependencies:
-  flutter_test:
-    sdk: flutter
-
-flutter:
-  uses-material-design: true
-  assets:
-{assets_block}
-"""
-
-    def _generate_readme(self, app_name: str) -> str:
-        """Create a README explaining next steps for the generated project."""
-        return f"""
-# {app_name}
-
-This project was generated using the App Builder for Windows.  It provides a
-minimal Flutter scaffold that displays any images you uploaded and includes
-optional paywall placeholders.  To continue building and publishing your app to
-the Apple App Store, follow these steps:
-
-1. **Install Flutter:** If you haven’t already, download and install Flutter from
-   [flutter.dev](https://flutter.dev).  Make sure you can run `flutter doctor` without
-   errors on your system.
-2. **Move project to macOS:** To build and publish an iOS app, you will need a
-   Mac with Xcode installed.  Copy this project to a Mac or use a cloud
-   continuous‑integration service that provides macOS build agents.
-3. **Add dependencies:** Open the `pubspec.yaml` file and add any additional
-   packages your app requires.  For paywalls, consider packages like
-   `in_app_purchase`.
-4. **Implement functionality:** Edit `lib/main.dart` and other Dart files to
-   implement your tool or game logic.  Replace the placeholder code with your
-   actual user interface and business logic.
-5. **Configure app:** Update the Flutter project’s bundle identifier, icons and
-   other metadata in the iOS `Runner` Xcode project.  You can find more details
-   in the Flutter documentation.
-6. **Test and publish:** Use `flutter build ios` to produce an iOS build.
-   Then open the generated Xcode workspace, run your app on a simulator or
-   device, fix any issues and submit through App Store Connect.
-
-Enjoy building your app!
-"""
+        return _MAIN_DART_TEMPLATE.substitute(
+            app_name=app_name,
+            app_type=app_type.lower(),
+            images_code=images_code,
+            paywall_code=paywall_code,
+        ).encode("utf-8")
+
+    def _generate_pubspec_yaml(self, asset_names: list) -> bytes:
+        """Generate a Flutter pubspec.yaml file listing the assets, as UTF-8 bytes."""
+        assets_block = "\n".join(f"    - assets/images/{image_name}" for image_name in asset_names)
+        return _PUBSPEC_HEAD_BYTES + assets_block.encode("utf-8") + b"\n"
+
+    def _generate_readme(self, app_name: str) -> bytes:
+        """Create a README explaining next steps for the generated project, as UTF-8 bytes."""
+        return b"\n# " + app_name.encode("utf-8") + _README_BODY_BYTES
 
 
 def main() -> None:
@@ -18,31 +18,118 @@ a new blank sheet, add rows or columns, compute sums and averages, filter rows
 by conditions, plot data, and save changes back to a file.
 """
 
+from __future__ import annotations
+
 import os
 import sys
-from typing import List, Optional
+import warnings
+from typing import TYPE_CHECKING, Dict, List, Optional
 
-try:
+if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
-except ImportError:
-    print("This program requires the pandas library. Please install it via 'pip install pandas'.")
-    sys.exit(1)
 
-try:
-    import matplotlib.pyplot as plt
-except ImportError:
-    print("This program requires the matplotlib library. Please install it via 'pip install matplotlib'.")
-    sys.exit(1)
+# pandas (with numpy) and matplotlib take a noticeable time to import, so they
+# are loaded on first use rather than at startup.  The menu appears
+# immediately and a session that never plots never imports matplotlib.
+np = None
+pd = None
+plt = None
+
+
+def _load_pandas() -> None:
+    """Import numpy and pandas if that has not happened yet."""
+    global np, pd
+    if pd is not None:
+        return
+    try:
+        import numpy as np
+        import pandas as pd
+    except ImportError:
+        print("This program requires the pandas library. Please install it via 'pip install pandas'.")
+        sys.exit(1)
+
+
+def _load_pyplot() -> bool:
+    """Import matplotlib.pyplot if needed; return False if it is not installed."""
+    global plt
+    if plt is not None:
+        return True
+    try:
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("This program requires the matplotlib library. Please install it via 'pip install matplotlib'.")
+        return False
+    return True
 
 
 class Spreadsheet:
     """A simple spreadsheet class wrapping a pandas DataFrame."""
 
     def __init__(self, df: Optional[pd.DataFrame] = None):
-        self.df = df if df is not None else pd.DataFrame()
+        # An empty frame is created on first access, so that constructing the
+        # sheet does not import pandas.
+        self._df = df
+        # Rows entered with add_row are buffered here and appended to the
+        # DataFrame in one go the next time the data is read.
+        self._pending_rows: List[List[str]] = []
+        # Numeric view of each column used by the aggregate commands.  Any
+        # method that changes the data must clear it.
+        self._numeric_cache: Dict[str, np.ndarray] = {}
+        # Figure and axes reused by every plot while the chart window is open.
+        self._fig = None
+        self._ax = None
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """The spreadsheet data, including any rows added since the last read."""
+        _load_pandas()
+        if self._df is None:
+            self._df = pd.DataFrame()
+        self._flush()
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame) -> None:
+        self._df = value
+        self._pending_rows.clear()
+        self._numeric_cache.clear()
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the sheet has no data, checked without flushing buffered rows."""
+        return self._df is None or self._df.empty
+
+    @property
+    def columns(self) -> pd.Index:
+        """The sheet's column labels, read without flushing buffered rows."""
+        return self.df.columns if self._df is None else self._df.columns
+
+    def _flush(self) -> None:
+        """Append the buffered rows to the DataFrame with a single concat."""
+        if self._pending_rows:
+            new_rows = pd.DataFrame(self._pending_rows, columns=self._df.columns)
+            self._df = pd.concat([self._df, new_rows], ignore_index=True)
+            self._pending_rows.clear()
+
+    def _num(self, col: str) -> np.ndarray:
+        """Return column ``col`` as a numeric array, parsing it on first use."""
+        arr = self._numeric_cache.get(col)
+        if arr is None:
+            series = self.df[col]
+            if not pd.api.types.is_numeric_dtype(series):
+                series = pd.to_numeric(series, errors='coerce')
+            if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'biu':
+                # Keep integer and bool columns exact; sums stay integers.
+                arr = series.to_numpy()
+            else:
+                arr = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            self._numeric_cache[col] = arr
+        return arr
 
     def load_csv(self, path: str) -> None:
         """Load data from a CSV file into the spreadsheet."""
+        _load_pandas()
         try:
             self.df = pd.read_csv(path)
             print(f"Loaded data with {len(self.df)} rows and {len(self.df.columns)} columns.")
@@ -56,7 +143,9 @@ class Spreadsheet:
     def save_csv(self, path: str) -> None:
         """Save the current spreadsheet to a CSV file."""
         try:
-            self.df.to_csv(path, index=False)
+            # pandas already writes in row chunks sized by the column count;
+            # only the output format is pinned here.
+            self.df.to_csv(path, index=False, lineterminator='\n', encoding='utf-8')
             print(f"Saved data to '{path}'.")
         except Exception as exc:
             print(f"Failed to save CSV: {exc}")
@@ -70,14 +159,18 @@ class Spreadsheet:
 
     def add_row(self, values: List[str]) -> None:
         """Add a new row to the spreadsheet. Values should match number of columns."""
-        if not self.df.empty and len(values) != len(self.df.columns):
-            print(f"Error: Expected {len(self.df.columns)} values but got {len(values)}.")
+        _load_pandas()
+        # Only the column layout is needed here, so avoid flushing the buffer
+        # on every call.
+        if not self.is_empty and len(values) != len(self.columns):
+            print(f"Error: Expected {len(self.columns)} values but got {len(values)}.")
             return
-        if self.df.empty:
+        if self.is_empty:
             # create column names if the sheet is empty
             self.df = pd.DataFrame([values])
         else:
-            self.df.loc[len(self.df)] = values
+            self._pending_rows.append(list(values))
+            self._numeric_cache.clear()
         print("Row added.")
 
     def add_column(self, name: str, values: List[str]) -> None:
@@ -86,6 +179,7 @@ class Spreadsheet:
             print(f"Error: Expected {len(self.df)} values but got {len(values)}.")
             return
         self.df[name] = values
+        self._numeric_cache.pop(name, None)
         print(f"Column '{name}' added.")
 
     def sum_column(self, col: str) -> None:
@@ -94,7 +188,7 @@ class Spreadsheet:
             print(f"Column '{col}' does not exist.")
             return
         try:
-            total = pd.to_numeric(self.df[col], errors='coerce').sum()
+            total = np.nansum(self._num(col))
             print(f"Sum of '{col}': {total}")
         except Exception as exc:
             print(f"Failed to compute sum: {exc}")
@@ -105,7 +199,10 @@ class Spreadsheet:
             print(f"Column '{col}' does not exist.")
             return
         try:
-            avg = pd.to_numeric(self.df[col], errors='coerce').mean()
+            with warnings.catch_warnings():
+                # An all-NaN column averages to NaN, as pandas' mean() did.
+                warnings.simplefilter('ignore', RuntimeWarning)
+                avg = np.nanmean(self._num(col))
             print(f"Average of '{col}': {avg}")
         except Exception as exc:
             print(f"Failed to compute average: {exc}")
@@ -115,7 +212,34 @@ class Spreadsheet:
         if col not in self.df.columns:
             print(f"Column '{col}' does not exist.")
             return
-        filtered = self.df[self.df[col].astype(str) == value]
+        series = self.df[col]
+        mask = None
+        if value.strip().lower() == 'nan':
+            # Filtering for missing cells only works through their string
+            # form, so leave it to the generic comparison below.
+            pass
+        elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            # Compare numerically in the column's own dtype.  Integer columns
+            # parse the value as an int so large IDs are matched exactly.
+            target = None
+            if pd.api.types.is_integer_dtype(series):
+                try:
+                    target = int(value)
+                except ValueError:
+                    pass
+            if target is None:
+                try:
+                    target = float(value)
+                except ValueError:
+                    pass
+            if target is not None:
+                mask = (series == target).to_numpy(dtype=bool, na_value=False)
+        elif pd.api.types.infer_dtype(series, skipna=True) == 'string':
+            mask = (series == value).to_numpy(dtype=bool, na_value=False)
+        if mask is None:
+            # Mixed or non-text values: fall back to comparing their string form.
+            mask = (series.astype(str) == value).to_numpy()
+        filtered = self.df[mask]
         if filtered.empty:
             print(f"No rows found where {col} == {value}.")
         else:
@@ -126,21 +250,32 @@ class Spreadsheet:
         if x_col not in self.df.columns or y_col not in self.df.columns:
             print("Error: one or both columns do not exist.")
             return
+        if kind not in ('line', 'bar'):
+            print("Unsupported chart type. Use 'line' or 'bar'.")
+            return
+        if not _load_pyplot():
+            return
         try:
-            x = pd.to_numeric(self.df[x_col], errors='coerce') if kind in ('line', 'bar') else self.df[x_col]
+            x = pd.to_numeric(self.df[x_col], errors='coerce')
             y = pd.to_numeric(self.df[y_col], errors='coerce')
-            plt.figure()
+            # Draw into the existing chart window if there is one, instead of
+            # opening (and keeping alive) a new figure for every plot.
+            if self._fig is None or not plt.fignum_exists(self._fig.number):
+                self._fig, self._ax = plt.subplots()
+            else:
+                self._ax.clear()
             if kind == 'line':
-                plt.plot(x, y)
-            elif kind == 'bar':
-                plt.bar(x, y)
+                self._ax.plot(x, y)
             else:
-                print("Unsupported chart type. Use 'line' or 'bar'.")
-                return
-            plt.title(f"{kind.title()} plot of {y_col} vs {x_col}")
-            plt.xlabel(x_col)
-            plt.ylabel(y_col)
-            plt.show()
+                self._ax.bar(x, y)
+            self._ax.set_title(f"{kind.title()} plot of {y_col} vs {x_col}")
+            self._ax.set_xlabel(x_col)
+            self._ax.set_ylabel(y_col)
+            self._fig.canvas.draw_idle()
+            # Show without blocking so the menu stays usable; the short pause
+            # lets the GUI backend render the window.
+            plt.show(block=False)
+            plt.pause(0.001)
         except Exception as exc:
             print(f"Failed to generate plot: {exc}")
 
@@ -178,11 +313,11 @@ def main() -> None:
                 n = 5
             sheet.view(n)
         elif choice == '4':
-            if sheet.df.empty:
+            if sheet.is_empty:
                 cols = int(input("Sheet is empty. How many columns in new row? "))
                 values = [input(f"Value for column {i+1}: ") for i in range(cols)]
             else:
-                values = [input(f"Value for '{col}': ") for col in sheet.df.columns]
+                values = [input(f"Value for '{col}': ") for col in sheet.columns]
             sheet.add_row(values)
         elif choice == '5':
             name = input("Enter new column name: ")